@@ -1,11 +1,15 @@
-from enum import Enum
-from typing import List, Optional
-class Sex(Enum):
+from collections import deque
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
+class Sex(IntEnum):
     """
-    Enumeration class representing the sex of a person
+    Enumeration class representing the sex of a person, stored as 0 or 1 so it fits in a uint8 column
     """
-    Male = 'm'
-    Female = 'f'
+    Male = 0
+    Female = 1
+
+SEX_LETTERS = ('m', 'f')
 
 class Person:
     """
@@ -16,19 +20,85 @@ class Person:
            sex (Sex): The sex of the person, can be either Male or Female.
            mother (Optional[Person]): Reference to the mother of the person, can be None.
            father (Optional[Person]): Reference to the father of the person, can be None.
+
+       Note:
+           The ascendants of a person are cached by get_ascendants. Setting mother or father
+           on any person bumps a shared version number, which invalidates every cached result,
+           since the descendants of a person are not tracked. The ancestor walks in this module
+           read the _mother and _father slots directly so only writes pay for the properties.
     """
+    __slots__ = ('name', 'sex', '_mother', '_father', '_ascendants', '_ascendants_version')
+
+    _links_version: int = 0
+
     def __init__(self, name: str, sex: Sex):
         self.name: str = name
         self.sex: Sex = sex
-        self.mother: Optional[Person] = None
-        self.father: Optional[Person] = None
+        self._mother: Optional[Person] = None
+        self._father: Optional[Person] = None
+        self._ascendants: Optional[Mapping[Person, int]] = None
+        self._ascendants_version: int = -1
+
+    @property
+    def mother(self) -> Optional['Person']:
+        return self._mother
+
+    @mother.setter
+    def mother(self, mother: Optional['Person']) -> None:
+        if mother is not self._mother:
+            self._mother = mother
+            Person._links_version += 1
+
+    @property
+    def father(self) -> Optional['Person']:
+        return self._father
+
+    @father.setter
+    def father(self, father: Optional['Person']) -> None:
+        if father is not self._father:
+            self._father = father
+            Person._links_version += 1
+
+def get_ascendants(person: Person) -> Mapping[Person, int]:
+    """
+       Returns all the ascendants of a person together with their generation.
+
+       The generation is 1 for parents, 2 for grandparents and so on. The result is
+       computed once per person and reused until a parent link changes anywhere, so it is
+       returned as a read-only mapping.
+
+       Args:
+           person (Person): The person whose ascendants are searched.
+
+       Returns:
+           Mapping[Person, int]: The generation of every ascendant of the person.
+    """
+    if person._ascendants_version == Person._links_version:
+        return person._ascendants
+
+    depths = {}
+    queue = deque([(person, 0)])
+    while queue:
+        current_person, depth = queue.popleft()
+        for parent in (current_person._father, current_person._mother):
+            if parent and parent not in depths:
+                depths[parent] = depth + 1
+                queue.append((parent, depth + 1))
+
+    person._ascendants = MappingProxyType(depths)
+    person._ascendants_version = Person._links_version
+    return person._ascendants
 
 def cousin_grade(person1: Person, person2: Person) -> int:
     """
        Calculates the cousin grade between two persons.
 
-       The cousin grade represents how many generations apart the two individuals have a common ancestor.
+       The cousin grade represents how many generations apart the two individuals have a common ancestor:
+       1 for siblings (common parent), 2 for first cousins (common grandparent) and so on.
+       Only the closest common ancestor is taken into account.
        If the two persons have no common ancestors, the cousin grade will be -1.
+       Siblings and first cousins are recognised from the parents and grandparents alone,
+       without collecting all the ascendants.
 
        Args:
            person1 (Person): The first person.
@@ -37,42 +107,24 @@ def cousin_grade(person1: Person, person2: Person) -> int:
        Returns:
            int: The cousin grade between the two persons.
     """
-    def get_ascendants(person: Person) -> set:
-        ascendants = set()
-        current_person = person
-        while current_person:
-            father = current_person.father
-            mother = current_person.mother
-            if father:
-                ascendants.add(father)
-                ascendants.update(get_ascendants(father))
-            if mother:
-                ascendants.add(mother)
-                ascendants.update(get_ascendants(mother))
-            current_person = None if (not father and not mother) else father or mother
-
-        return ascendants
+    parents1 = [parent for parent in (person1._father, person1._mother) if parent]
+    parents2 = [parent for parent in (person2._father, person2._mother) if parent]
+    if any(parent in parents2 for parent in parents1):
+        return 1
+
+    close1 = parents1 + [grandparent for parent in parents1 for grandparent in (parent._father, parent._mother) if grandparent]
+    close2 = parents2 + [grandparent for parent in parents2 for grandparent in (parent._father, parent._mother) if grandparent]
+    if any(ascendant in close2 for ascendant in close1):
+        return 2
 
     ascendants1 = get_ascendants(person1)
     ascendants2 = get_ascendants(person2)
 
-    common_ascendants = ascendants1 & ascendants2
+    common_ascendants = ascendants1.keys() & ascendants2.keys()
     if len(common_ascendants) == 0:
         return -1
 
-    grade = 0
-    while common_ascendants:
-        grade += 1
-        new_common_ascendants = set()
-        for ascendant in common_ascendants:
-            if ascendant.father:
-                new_common_ascendants.add(ascendant.father)
-            if ascendant.mother:
-                new_common_ascendants.add(ascendant.mother)
-
-        common_ascendants = new_common_ascendants
-
-    return grade
+    return min(max(ascendants1[ascendant], ascendants2[ascendant]) for ascendant in common_ascendants)
 class Adult(Person):
     """
      Subclass of Person representing an adult with a job, marriage status, and children.
@@ -84,6 +136,8 @@ class Adult(Person):
         married_to (Optional[Person]): Reference to the adult is married to, can be None if not married.
         children_list (List[Child]): List of children the adult has.
     """
+    __slots__ = ('job', 'married_to', 'children_list')
+
     def __init__(self, nume: str, sex: Sex, job: str):
         super().__init__(nume, sex)
         self.job: str = job
@@ -97,9 +151,9 @@ class Adult(Person):
             Returns:
                 str: A formatted string with information about the adult.
          """
-        children = ', '.join([child.name for child in self.children_list]) if self.children_list else 'None'
+        children = ', '.join(child.name for child in self.children_list) or 'None'
         married_to = self.married_to.name if self.married_to else 'No one'
-        return f'Nume: {self.name}, Sex: {self.sex.value}, Job: {self.job}, Children: {children}, Married to: {married_to}'
+        return f'Nume: {self.name}, Sex: {SEX_LETTERS[self.sex]}, Job: {self.job}, Children: {children}, Married to: {married_to}'
 
     def have_child_with(self, other_person, child_name: str, sex_child: Sex, school: str) -> 'Child':
         """
@@ -123,6 +177,8 @@ class Adult(Person):
         child = Child(child_name, sex_child, school, self, other_person)
         self.children_list.append(child)
         other_person.children_list.append(child)
+        child._mother_index = len(self.children_list) - 1
+        child._father_index = len(other_person.children_list) - 1
 
         return child
 
@@ -170,11 +226,16 @@ class Child(Person):
         father (Adult): Reference to the father of the child.
         mother (Adult): Reference to the mother of the child.
     """
+    __slots__ = ('school', '_mother_index', '_father_index')
+
     def __init__(self, nume: str, sex: Sex, school: str, mother: Adult, father: Adult):
         super().__init__(nume, sex)
         self.school: str = school
-        self.father: Adult = father
-        self.mother: Adult = mother
+        # A new child has no descendants whose cached ascendants could be stale.
+        self._father: Adult = father
+        self._mother: Adult = mother
+        self._mother_index: Optional[int] = None
+        self._father_index: Optional[int] = None
 
     def description(self) -> str:
         """
@@ -183,7 +244,7 @@ class Child(Person):
         Returns:
             str: A formatted string with information about the child.
         """
-        return f'Nume: {self.name}, Sex:{self.sex.value}, School: {self.school}, Mother: {self.mother.name}, Father: {self.father.name}'
+        return f'Nume: {self.name}, Sex:{SEX_LETTERS[self.sex]}, School: {self.school}, Mother: {self.mother.name}, Father: {self.father.name}'
 
     def become_adult(self, job: str) -> 'Adult':
         """
@@ -195,13 +256,16 @@ class Child(Person):
         Returns:
             Adult: The newly created adult object.
 
+        Raises:
+            ValueError: If the child is not among its parents' children, for example because it already became an adult.
+
         Note:
             This method updates the child's school attribute to None.
         """
-        adult = Adult(self.name, self.sex, job)
-        index_in_mother = self.mother.children_list.index(self)
-        index_in_father = self.father.children_list.index(self)
+        index_in_mother = self._position_in(self.mother.children_list, self._mother_index)
+        index_in_father = self._position_in(self.father.children_list, self._father_index)
 
+        adult = Adult(self.name, self.sex, job)
         self.mother.children_list[index_in_mother] = adult
         self.father.children_list[index_in_father] = adult
 
@@ -209,52 +273,60 @@ class Child(Person):
 
         return adult
 
-adult1 = Adult('Ion', Sex.Male, 'engineer')
-adult2 = Adult('Elena', Sex.Female, 'doctor')
-adult3 = Adult('Bogdan', Sex.Male, 'lawyer')
-adult4 = Adult('Ana', Sex.Female, 'teacher')
+    def _position_in(self, children: List['Child'], index: Optional[int]) -> int:
+        if index is not None and index < len(children) and children[index] is self:
+            return index
+        return children.index(self)
+
+def _demo() -> None:
+    adult1 = Adult('Ion', Sex.Male, 'engineer')
+    adult2 = Adult('Elena', Sex.Female, 'doctor')
+    adult3 = Adult('Bogdan', Sex.Male, 'lawyer')
+    adult4 = Adult('Ana', Sex.Female, 'teacher')
 
-adult1.marriage(adult2)
-adult2.divorce(adult1)
-adult2.marriage(adult3)
+    adult1.marriage(adult2)
+    adult2.divorce(adult1)
+    adult2.marriage(adult3)
 
-child1 = adult2.have_child_with(adult1, 'Alex', Sex.Male, 'Primary School')
-child2 = adult4.have_child_with(adult1, 'Ioana', Sex.Female, 'High school ')
+    child1 = adult2.have_child_with(adult1, 'Alex', Sex.Male, 'Primary School')
+    child2 = adult4.have_child_with(adult1, 'Ioana', Sex.Female, 'High school ')
 
-child3 = adult2.have_child_with(adult1, 'Alexandra', Sex.Female, 'Primary School')
-child4 = adult2.have_child_with(adult3, 'Ionel', Sex.Male, 'High school')
+    child3 = adult2.have_child_with(adult1, 'Alexandra', Sex.Female, 'Primary School')
+    child4 = adult2.have_child_with(adult3, 'Ionel', Sex.Male, 'High school')
 
-print('Information about adults: ')
-print(adult1.description())
-print(adult2.description())
-print(adult3.description())
-print(adult4.description())
+    print('Information about adults: ')
+    print(adult1.description())
+    print(adult2.description())
+    print(adult3.description())
+    print(adult4.description())
 
-print('\nInformation about children: ')
-print(child1.description())
-print(child2.description())
-print(child3.description())
-print(child4.description())
+    print('\nInformation about children: ')
+    print(child1.description())
+    print(child2.description())
+    print(child3.description())
+    print(child4.description())
 
-print('\nChildren become Adults')
-new_adult = child1.become_adult('dancer')
-print(new_adult.description())
+    print('\nChildren become Adults')
+    new_adult = child1.become_adult('dancer')
+    print(new_adult.description())
 
-print('\nCousin Grade: ')
+    print('\nCousin Grade: ')
 
-parent1 = Person('Vasile', Sex.Male)
-parent2 = Person('Maria', Sex.Female)
-parent3 = Person('Gheorghe', Sex.Male)
-parent4 = Person('Mihaela', Sex.Female)
-parent5 = Person('Ioan', Sex.Male)
+    parent1 = Person('Vasile', Sex.Male)
+    parent2 = Person('Maria', Sex.Female)
+    parent3 = Person('Gheorghe', Sex.Male)
+    parent4 = Person('Mihaela', Sex.Female)
+    parent5 = Person('Ioan', Sex.Male)
 
-adult1.mother = parent2
-adult1.father = parent1
-adult2.mother = parent3
-adult2.father = parent4
+    adult1.mother = parent2
+    adult1.father = parent1
+    adult2.mother = parent3
+    adult2.father = parent4
 
-parent1.father = parent5
-parent4.father = parent5
+    parent1.father = parent5
+    parent4.father = parent5
 
-print(f'The degree of {adult1.name} and {adult2.name}: {cousin_grade(adult1, adult2)}')
+    print(f'The degree of {adult1.name} and {adult2.name}: {cousin_grade(adult1, adult2)}')
 
+if __name__ == '__main__':
+    _demo()
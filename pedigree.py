@@ -0,0 +1,236 @@
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+from numba import njit
+
+from first_classes import Person
+
+@njit(cache=True)
+def _ancestor_depths(father_of: np.ndarray, mother_of: np.ndarray, person: int,
+                     depth: np.ndarray, queue: np.ndarray) -> int:
+    """
+       Walks the ancestors of a person breadth first.
+
+       Every ancestor gets its generation written in depth (1 for parents, 2 for grandparents...)
+       and is appended to queue. The person itself is stored at queue[0] and keeps a depth of -1.
+
+       Args:
+           father_of (np.ndarray): Index of the father of every person, -1 if unknown.
+           mother_of (np.ndarray): Index of the mother of every person, -1 if unknown.
+           person (int): Index of the person whose ancestors are searched.
+           depth (np.ndarray): Array filled with -1, receives the generation of the ancestors.
+           queue (np.ndarray): Scratch array, receives the person followed by its ancestors.
+
+       Returns:
+           int: The number of entries written in queue.
+    """
+    depth[person] = 0
+    queue[0] = person
+    head = 0
+    count = 1
+    while head < count:
+        current = queue[head]
+        head += 1
+        for parent in (father_of[current], mother_of[current]):
+            if parent >= 0 and depth[parent] < 0:
+                depth[parent] = depth[current] + 1
+                queue[count] = parent
+                count += 1
+
+    depth[person] = -1
+    return count
+
+@njit(cache=True)
+def _cousin_grade(father_of: np.ndarray, mother_of: np.ndarray, person1: int, person2: int,
+                  depth1: np.ndarray, depth2: np.ndarray, queue1: np.ndarray, queue2: np.ndarray) -> int:
+    """
+       Calculates the cousin grade between two persons using preallocated scratch arrays.
+
+       The depth arrays must be filled with -1; only the entries touched by the query are reset
+       before returning, so the same arrays can serve the next query. The common ancestors are
+       found by looking up every ancestor of the first person in the depth array of the second,
+       so a query costs O(ancestors) and never scans a whole array.
+    """
+    count1 = _ancestor_depths(father_of, mother_of, person1, depth1, queue1)
+    count2 = _ancestor_depths(father_of, mother_of, person2, depth2, queue2)
+
+    grade = -1
+    for k in range(1, count1):
+        ancestor = queue1[k]
+        if depth2[ancestor] >= 0:
+            candidate = max(depth1[ancestor], depth2[ancestor])
+            if grade < 0 or candidate < grade:
+                grade = candidate
+
+    for k in range(1, count1):
+        depth1[queue1[k]] = -1
+    for k in range(1, count2):
+        depth2[queue2[k]] = -1
+
+    return grade
+
+@njit(cache=True)
+def cousin_grade_nb(father_of: np.ndarray, mother_of: np.ndarray, person1: int, person2: int) -> int:
+    """
+       Calculates the cousin grade between two persons of a pedigree given by index.
+
+       Args:
+           father_of (np.ndarray): Index of the father of every person, -1 if unknown.
+           mother_of (np.ndarray): Index of the mother of every person, -1 if unknown.
+           person1 (int): Index of the first person.
+           person2 (int): Index of the second person.
+
+       Returns:
+           int: The generation of the closest common ancestor, -1 if there is none.
+    """
+    n = father_of.shape[0]
+    return _cousin_grade(father_of, mother_of, person1, person2,
+                         np.full(n, -1, np.int32), np.full(n, -1, np.int32),
+                         np.empty(n, np.int32), np.empty(n, np.int32))
+
+@njit(cache=True)
+def _ancestor_table(father_of: np.ndarray, mother_of: np.ndarray, members: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+       Collects the ancestors of several persons in a compressed table.
+
+       The ancestors of members[m] and their generations are stored in ancestors[offsets[m]:offsets[m + 1]]
+       and depths[offsets[m]:offsets[m + 1]].
+
+       Returns:
+           Tuple[np.ndarray, np.ndarray, np.ndarray]: The offsets, ancestors and depths arrays.
+    """
+    n = father_of.shape[0]
+    depth = np.full(n, -1, np.int32)
+    queue = np.empty(n, np.int32)
+    offsets = np.zeros(members.shape[0] + 1, np.int64)
+    ancestors = np.empty(n, np.int32)
+    depths = np.empty(n, np.int32)
+    size = 0
+    for m in range(members.shape[0]):
+        count = _ancestor_depths(father_of, mother_of, members[m], depth, queue)
+        while size + count - 1 > ancestors.shape[0]:
+            ancestors = np.concatenate((ancestors, np.empty(ancestors.shape[0], np.int32)))
+            depths = np.concatenate((depths, np.empty(depths.shape[0], np.int32)))
+        for k in range(1, count):
+            ancestor = queue[k]
+            ancestors[size] = ancestor
+            depths[size] = depth[ancestor]
+            depth[ancestor] = -1
+            size += 1
+        offsets[m + 1] = size
+
+    return offsets, ancestors[:size], depths[:size]
+
+@njit(cache=True)
+def _batch_grades(offsets: np.ndarray, ancestors: np.ndarray, depths: np.ndarray, n: int,
+                  firsts: np.ndarray, seconds: np.ndarray) -> np.ndarray:
+    """
+       Calculates the cousin grade of every pair (firsts[q], seconds[q]) of rows of an ancestor table.
+    """
+    scratch = np.full(n, -1, np.int32)
+    grades = np.empty(firsts.shape[0], np.int32)
+    for q in range(firsts.shape[0]):
+        first = firsts[q]
+        second = seconds[q]
+        for k in range(offsets[first], offsets[first + 1]):
+            scratch[ancestors[k]] = depths[k]
+
+        grade = -1
+        for k in range(offsets[second], offsets[second + 1]):
+            depth1 = scratch[ancestors[k]]
+            if depth1 > 0:
+                candidate = max(depth1, depths[k])
+                if grade < 0 or candidate < grade:
+                    grade = candidate
+        grades[q] = grade
+
+        for k in range(offsets[first], offsets[first + 1]):
+            scratch[ancestors[k]] = -1
+
+    return grades
+
+class Pedigree:
+    """
+       Family tree stored as parallel arrays, one entry per person, for fast cousin grade queries.
+
+       The given persons and all of their ancestors are numbered from 0; parent links become indexes.
+
+       Attributes:
+           father_of (np.ndarray): Index of the father of every person, -1 if unknown.
+           mother_of (np.ndarray): Index of the mother of every person, -1 if unknown.
+           names (List[str]): The name of every person.
+           sex_of (np.ndarray): The sex of every person as uint8, 0 for Male and 1 for Female.
+
+       Note:
+           The scratch arrays used by cousin_grade are allocated once per pedigree and reused by every
+           query, so a pedigree should not be queried from several threads at the same time.
+    """
+    def __init__(self, persons: Iterable[Person]):
+        self._index: Dict[Person, int] = {}
+        members: List[Person] = []
+        queue = deque(persons)
+        while queue:
+            person = queue.popleft()
+            if person is None or person in self._index:
+                continue
+            self._index[person] = len(members)
+            members.append(person)
+            queue.append(person.father)
+            queue.append(person.mother)
+
+        self.father_of: np.ndarray = np.array([self._index.get(person.father, -1) for person in members], dtype=np.int32)
+        self.mother_of: np.ndarray = np.array([self._index.get(person.mother, -1) for person in members], dtype=np.int32)
+        self.names: List[str] = [person.name for person in members]
+        self.sex_of: np.ndarray = np.array([person.sex for person in members], dtype=np.uint8)
+
+        n = len(members)
+        self._depths = (np.full(n, -1, np.int32), np.full(n, -1, np.int32))
+        self._queues = (np.empty(n, np.int32), np.empty(n, np.int32))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def index_of(self, person: Person) -> int:
+        """
+           Returns the index of a person in the pedigree.
+
+           Raises:
+               KeyError: If the person is not part of the pedigree.
+        """
+        return self._index[person]
+
+    def cousin_grade(self, person1: Person, person2: Person) -> int:
+        """
+           Calculates the cousin grade between two persons of the pedigree, same as first_classes.cousin_grade.
+
+           Args:
+               person1 (Person): The first person.
+               person2 (Person): The second person.
+
+           Returns:
+               int: The cousin grade between the two persons.
+        """
+        return int(_cousin_grade(self.father_of, self.mother_of, self._index[person1], self._index[person2],
+                                 *self._depths, *self._queues))
+
+    def batch_cousin_grades(self, pairs: Iterable[Tuple[Person, Person]]) -> np.ndarray:
+        """
+           Calculates the cousin grade of many pairs of persons of the pedigree.
+
+           The ancestors of every distinct person are collected once and shared by all the pairs
+           that contain that person, instead of walking them again for every query.
+
+           Args:
+               pairs (Iterable[Tuple[Person, Person]]): The pairs of persons.
+
+           Returns:
+               np.ndarray: The cousin grade of every pair, in the order of the pairs.
+        """
+        pairs = list(pairs)
+        firsts = np.array([self._index[person1] for person1, _ in pairs], dtype=np.int32)
+        seconds = np.array([self._index[person2] for _, person2 in pairs], dtype=np.int32)
+        members, rows = np.unique(np.concatenate((firsts, seconds)), return_inverse=True)
+        offsets, ancestors, depths = _ancestor_table(self.father_of, self.mother_of, members.astype(np.int32))
+        rows = rows.astype(np.int64)
+        return _batch_grades(offsets, ancestors, depths, len(self), rows[:len(pairs)], rows[len(pairs):])
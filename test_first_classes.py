@@ -0,0 +1,95 @@
+import unittest
+
+from first_classes import Adult, Child, Person, Sex, cousin_grade, get_ascendants
+
+class BecomeAdultTest(unittest.TestCase):
+    def setUp(self):
+        self.father = Adult('Ion', Sex.Male, 'engineer')
+        self.mother = Adult('Elena', Sex.Female, 'doctor')
+        self.other_mother = Adult('Ana', Sex.Female, 'teacher')
+        self.other_father = Adult('Bogdan', Sex.Male, 'lawyer')
+        self.alex = self.mother.have_child_with(self.father, 'Alex', Sex.Male, 'Primary School')
+        self.ioana = self.other_mother.have_child_with(self.father, 'Ioana', Sex.Female, 'High school')
+        self.ionel = self.mother.have_child_with(self.other_father, 'Ionel', Sex.Male, 'High school')
+        self.alexandra = self.mother.have_child_with(self.father, 'Alexandra', Sex.Female, 'Primary School')
+
+    def test_adult_replaces_child_in_both_parents(self):
+        adult = self.alexandra.become_adult('dancer')
+        self.assertEqual(self.father.children_list, [self.alex, self.ioana, adult])
+        self.assertEqual(self.mother.children_list, [self.alex, self.ionel, adult])
+        self.assertEqual(self.other_mother.children_list, [self.ioana])
+        self.assertIsNone(self.alexandra.school)
+
+    def test_child_not_created_by_parents_is_found_by_scan(self):
+        child = Child('Maria', Sex.Female, 'Primary School', self.mother, self.father)
+        self.mother.children_list.insert(0, child)
+        self.father.children_list.append(child)
+        adult = child.become_adult('pilot')
+        self.assertIs(self.mother.children_list[0], adult)
+        self.assertIs(self.father.children_list[-1], adult)
+
+    def test_moved_child_is_found_by_scan(self):
+        self.father.children_list.remove(self.alex)
+        adult = self.alexandra.become_adult('dancer')
+        self.assertEqual(self.father.children_list, [self.ioana, adult])
+
+    def test_second_promotion_raises(self):
+        adult = self.alex.become_adult('dancer')
+        with self.assertRaises(ValueError):
+            self.alex.become_adult('singer')
+        self.assertEqual(self.father.children_list, [adult, self.ioana, self.alexandra])
+        self.assertEqual(self.mother.children_list, [adult, self.ionel, self.alexandra])
+
+class AscendantsCacheTest(unittest.TestCase):
+    def setUp(self):
+        # Two lines of three generations with no common ancestor yet.
+        self.person1 = Person('Ion', Sex.Male)
+        self.parent1 = Person('Vasile', Sex.Male)
+        self.grandparent1 = Person('Gheorghe', Sex.Male)
+        self.person2 = Person('Elena', Sex.Female)
+        self.parent2 = Person('Maria', Sex.Female)
+        self.grandparent2 = Person('Mihaela', Sex.Female)
+        self.person1.father = self.parent1
+        self.parent1.father = self.grandparent1
+        self.person2.mother = self.parent2
+        self.parent2.mother = self.grandparent2
+
+    def test_grandparent_link_invalidates_cached_grade(self):
+        self.assertEqual(cousin_grade(self.person1, self.person2), -1)
+        self.assertNotIn(self.grandparent2, get_ascendants(self.person1))
+
+        ancestor = Person('Ioan', Sex.Male)
+        self.grandparent1.father = ancestor
+        self.grandparent2.father = ancestor
+        self.assertEqual(get_ascendants(self.person1)[ancestor], 3)
+        self.assertEqual(cousin_grade(self.person1, self.person2), 3)
+
+        self.grandparent2.father = None
+        self.assertEqual(cousin_grade(self.person1, self.person2), -1)
+
+    def test_cached_ascendants_are_read_only(self):
+        with self.assertRaises(TypeError):
+            get_ascendants(self.person1)[self.person2] = 1
+
+    def test_child_created_after_cache_is_warm(self):
+        ancestor = Person('Ioan', Sex.Male)
+        self.grandparent1.father = ancestor
+        self.grandparent2.father = ancestor
+        father = Adult('Bogdan', Sex.Male, 'lawyer')
+        father.father = self.person1
+        mother = Adult('Ana', Sex.Female, 'teacher')
+        self.assertEqual(cousin_grade(father, self.person2), 4)
+
+        child = mother.have_child_with(father, 'Alex', Sex.Male, 'Primary School')
+        self.assertEqual(dict(get_ascendants(child)), {
+            father: 1, mother: 1, self.person1: 2, self.parent1: 3, self.grandparent1: 4, ancestor: 5,
+        })
+        self.assertEqual(cousin_grade(child, self.person2), 5)
+        self.assertEqual(cousin_grade(father, self.person2), 4)
+
+        sibling = mother.have_child_with(father, 'Ioana', Sex.Female, 'Primary School')
+        self.assertEqual(cousin_grade(child, sibling), 1)
+        self.assertEqual(cousin_grade(sibling, self.person2), 5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import itertools
+import random
+import unittest
+
+from first_classes import Person, Sex, cousin_grade
+from pedigree import Pedigree, cousin_grade_nb
+
+def random_family(size: int, seed: int) -> list:
+    rng = random.Random(seed)
+    persons = []
+    for i in range(size):
+        person = Person(f'p{i}', rng.choice(list(Sex)))
+        if i >= 10:
+            recent = persons[max(0, i - 40):i]
+            person.father = rng.choice(recent) if rng.random() < 0.9 else None
+            person.mother = rng.choice(recent) if rng.random() < 0.9 else None
+        persons.append(person)
+    return persons
+
+class PedigreeTest(unittest.TestCase):
+    def setUp(self):
+        # Two founders whose descendants marry each other, so most ancestors are reached twice.
+        self.founder1 = Person('Ioan', Sex.Male)
+        self.founder2 = Person('Maria', Sex.Female)
+        self.son = Person('Vasile', Sex.Male)
+        self.daughter = Person('Elena', Sex.Female)
+        self.outsider = Person('Ana', Sex.Female)
+        self.grandson = Person('Ion', Sex.Male)
+        self.granddaughter = Person('Ioana', Sex.Female)
+        self.great_grandson = Person('Alex', Sex.Male)
+        self.stranger = Person('Bogdan', Sex.Male)
+        for child in (self.son, self.daughter):
+            child.father, child.mother = self.founder1, self.founder2
+        self.grandson.father, self.grandson.mother = self.son, self.outsider
+        self.granddaughter.father, self.granddaughter.mother = self.son, self.daughter
+        self.great_grandson.father, self.great_grandson.mother = self.grandson, self.granddaughter
+        self.persons = [self.founder1, self.founder2, self.son, self.daughter, self.outsider,
+                        self.grandson, self.granddaughter, self.great_grandson, self.stranger]
+
+    def assert_matches_python(self, persons: list, pairs: list):
+        pedigree = Pedigree(persons)
+        expected = [cousin_grade(person1, person2) for person1, person2 in pairs]
+        self.assertEqual([pedigree.cousin_grade(person1, person2) for person1, person2 in pairs], expected)
+        self.assertEqual([cousin_grade_nb(pedigree.father_of, pedigree.mother_of,
+                                          pedigree.index_of(person1), pedigree.index_of(person2))
+                          for person1, person2 in pairs], expected)
+        self.assertEqual(pedigree.batch_cousin_grades(pairs).tolist(), expected)
+
+    def test_known_grades(self):
+        pedigree = Pedigree([self.great_grandson, self.stranger])
+        self.assertEqual(pedigree.cousin_grade(self.son, self.daughter), 1)
+        self.assertEqual(pedigree.cousin_grade(self.grandson, self.granddaughter), 1)
+        # The daughter is an ascendant of the great grandson but not a common ancestor of the two.
+        self.assertEqual(pedigree.cousin_grade(self.great_grandson, self.daughter), 3)
+        self.assertEqual(pedigree.cousin_grade(self.great_grandson, self.stranger), -1)
+
+    def test_small_family_matches_python(self):
+        self.assert_matches_python(self.persons, list(itertools.permutations(self.persons, 2)))
+
+    def test_random_family_matches_python(self):
+        persons = random_family(300, seed=7)
+        rng = random.Random(11)
+        pairs = [tuple(rng.sample(persons, 2)) for _ in range(1000)]
+        self.assert_matches_python(persons, pairs)
+
+    def test_sex_column(self):
+        pedigree = Pedigree([self.son, self.daughter])
+        self.assertEqual(pedigree.sex_of[pedigree.index_of(self.son)], Sex.Male)
+        self.assertEqual(pedigree.sex_of[pedigree.index_of(self.daughter)], Sex.Female)
+
+    def test_empty_batch(self):
+        self.assertEqual(len(Pedigree(self.persons).batch_cousin_grades([])), 0)
+
+if __name__ == '__main__':
+    unittest.main()